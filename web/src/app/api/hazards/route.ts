@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
-import { parseLatLng, parseNumber } from "@/lib/geo";
+import { clamp, parseLatLng, parseNumber } from "@/lib/geo";
 import { buildHazardsSummary } from "@/lib/hazards";
 
 export const dynamic = "force-dynamic";
@@ -8,8 +8,10 @@ export async function GET(req: NextRequest) {
   try {
     const { searchParams } = new URL(req.url);
     const latlng = parseLatLng(searchParams.get("lat") ?? undefined, searchParams.get("lng") ?? undefined);
-    const radiusKm = parseNumber(searchParams.get("radiusKm") ?? undefined, 100);
-    const years = parseNumber(searchParams.get("years") ?? undefined, 5);
+    // Clamp to sane bounds so an oversized query can't fan out into huge
+    // upstream requests; the UI only offers values well inside these.
+    const radiusKm = clamp(parseNumber(searchParams.get("radiusKm") ?? undefined, 100), 1, 1000);
+    const years = clamp(parseNumber(searchParams.get("years") ?? undefined, 5), 1, 20);
     if (!latlng) {
       return NextResponse.json({ error: "Invalid lat/lng" }, { status: 400 });
     }
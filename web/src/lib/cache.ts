@@ -0,0 +1,53 @@
+// Tiny in-memory TTL + LRU cache for upstream lookups. Per-process only,
+// which is fine for the demo deployment (single Next.js server).
+
+type Entry<V> = { value: V; expiresAt: number };
+
+export class TtlCache<V> {
+  private entries = new Map<string, Entry<V>>();
+
+  constructor(private readonly maxSize: number, private readonly ttlMs: number) {}
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // Map preserves insertion order; re-inserting marks the key as
+    // recently used so eviction below stays LRU.
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V): void {
+    if (this.entries.has(key)) {
+      this.entries.delete(key);
+    } else if (this.entries.size >= this.maxSize) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest !== undefined) this.entries.delete(oldest);
+    }
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+}
+
+// Coalesce concurrent calls for the same key: the first caller does the
+// work, everyone else awaits the same promise. Entries only live for the
+// duration of the in-flight request, so failures are not cached.
+const inFlight = new Map<string, Promise<unknown>>();
+
+export function singleFlight<T>(key: string, fn: () => Promise<T>): Promise<T> {
+  const existing = inFlight.get(key);
+  if (existing) return existing as Promise<T>;
+  const pending = fn().finally(() => {
+    inFlight.delete(key);
+  });
+  inFlight.set(key, pending);
+  return pending;
+}
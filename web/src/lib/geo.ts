@@ -18,6 +18,20 @@ export function haversineDistanceKm(a: LatLng, b: LatLng): number {
   return R * c;
 }
 
+// For distance checks against many points from one origin, precompute the
+// origin-dependent terms once instead of redoing them per candidate.
+export function makeDistanceKmFrom(origin: LatLng): (p: LatLng) => number {
+  const R = 6371; // km
+  const lat1 = toRadians(origin.lat);
+  const cosLat1 = Math.cos(lat1);
+  return (p: LatLng) => {
+    const sinDLat = Math.sin(toRadians(p.lat - origin.lat) / 2);
+    const sinDLng = Math.sin(toRadians(p.lng - origin.lng) / 2);
+    const h = sinDLat * sinDLat + cosLat1 * Math.cos(toRadians(p.lat)) * sinDLng * sinDLng;
+    return R * 2 * Math.atan2(Math.sqrt(h), Math.sqrt(1 - h));
+  };
+}
+
 export function clamp(value: number, min: number, max: number): number {
   return Math.max(min, Math.min(max, value));
 }
@@ -43,8 +57,29 @@ export function isoDateNDaysAgo(days: number): string {
   return d.toISOString().slice(0, 10);
 }
 
+// These date strings only change at (UTC) midnight, so derive them at most
+// once per hour instead of building Date objects on every request.
+let dateCacheHour = -1;
+let cachedTodayIso = "";
+const isoByYearsAgo = new Map<number, string>();
+
+export function todayIso(): string {
+  const hour = Math.floor(Date.now() / 3_600_000);
+  if (hour !== dateCacheHour) {
+    dateCacheHour = hour;
+    cachedTodayIso = new Date().toISOString().slice(0, 10);
+    isoByYearsAgo.clear();
+  }
+  return cachedTodayIso;
+}
+
 export function isoDateNYearsAgo(years: number): string {
+  todayIso(); // rolls the cache over when the hour changes
+  const cached = isoByYearsAgo.get(years);
+  if (cached !== undefined) return cached;
   const d = new Date();
   d.setFullYear(d.getFullYear() - years);
-  return d.toISOString().slice(0, 10);
+  const iso = d.toISOString().slice(0, 10);
+  isoByYearsAgo.set(years, iso);
+  return iso;
 }
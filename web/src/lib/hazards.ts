@@ -1,4 +1,6 @@
-import { LatLng, haversineDistanceKm, isoDateNYearsAgo } from "@/lib/geo";
+import { singleFlight, TtlCache } from "@/lib/cache";
+import { LatLng, isoDateNYearsAgo, makeDistanceKmFrom, todayIso } from "@/lib/geo";
+import { fetchJson } from "@/lib/http";
 
 export type EonetEvent = {
   id: string;
@@ -50,18 +52,16 @@ const EONET_BASE = "https://eonet.gsfc.nasa.gov/api/v3";
 export async function fetchEonetEvents(center: LatLng, radiusKm: number, lookbackYears: number): Promise<EonetEvent[]> {
   const days = Math.max(30, Math.min(365 * lookbackYears, 3650));
   const url = `${EONET_BASE}/events?status=all&days=${encodeURIComponent(days)}&limit=500`;
-  const res = await fetch(url, { next: { revalidate: 3600 } });
-  if (!res.ok) throw new Error(`EONET request failed: ${res.status}`);
-  const data = await res.json();
+  const data = await fetchJson<{ events?: EonetEvent[] }>(url, { revalidate: 3600, label: "EONET request" });
   const events: EonetEvent[] = data.events ?? [];
   // Filter by distance to any geometry point
+  const distanceFrom = makeDistanceKmFrom(center);
   const filtered = events.filter((ev) => {
     return ev.geometry?.some((g) => {
       const coords = g.coordinates;
       if (!Array.isArray(coords) || coords.length < 2) return false;
       const [lng, lat] = coords;
-      const d = haversineDistanceKm(center, { lat, lng });
-      return d <= radiusKm;
+      return distanceFrom({ lat, lng }) <= radiusKm;
     });
   });
   return filtered;
@@ -72,7 +72,7 @@ export async function fetchEarthquakes(center: LatLng, radiusKm: number, lookbac
   const params = new URLSearchParams({
     format: "geojson",
     starttime: start,
-    endtime: new Date().toISOString().slice(0, 10),
+    endtime: todayIso(),
     latitude: String(center.lat),
     longitude: String(center.lng),
     maxradiuskm: String(radiusKm),
@@ -81,25 +81,56 @@ export async function fetchEarthquakes(center: LatLng, radiusKm: number, lookbac
     limit: "20000",
   });
   const url = `https://earthquake.usgs.gov/fdsnws/event/1/query?${params.toString()}`;
-  const res = await fetch(url, { next: { revalidate: 600 } });
-  if (!res.ok) throw new Error(`USGS earthquake request failed: ${res.status}`);
-  const data = await res.json();
+  const data = await fetchJson<{ features?: EarthquakeFeature[] }>(url, {
+    revalidate: 600,
+    timeoutMs: 60_000,
+    label: "USGS earthquake request",
+  });
   const features: EarthquakeFeature[] = data.features ?? [];
   return features;
 }
 
+// Hazard history barely changes minute to minute, and /api/hazards and
+// /api/advice both build the same summary for the same view. Rounding the
+// center to ~1 km collapses jittery geolocation fixes onto one key; the
+// cached summary's center can therefore differ from the request by up to
+// that much, which is noise at the radii we query.
+const summaryCache = new TtlCache<HazardsSummary>(200, 600_000);
+
+function summaryCacheKey(center: LatLng, radiusKm: number, lookbackYears: number): string {
+  return `${center.lat.toFixed(2)},${center.lng.toFixed(2)}|${radiusKm}|${lookbackYears}`;
+}
+
 export async function buildHazardsSummary(center: LatLng, radiusKm: number, lookbackYears: number): Promise<HazardsSummary> {
+  const cacheKey = summaryCacheKey(center, radiusKm, lookbackYears);
+  const cached = summaryCache.get(cacheKey);
+  if (cached) return cached;
+  // On a cold key, concurrent identical requests (e.g. /api/hazards and
+  // /api/advice fired together by the page) share one upstream fetch.
+  return singleFlight(cacheKey, () => computeHazardsSummary(cacheKey, center, radiusKm, lookbackYears));
+}
+
+async function computeHazardsSummary(
+  cacheKey: string,
+  center: LatLng,
+  radiusKm: number,
+  lookbackYears: number
+): Promise<HazardsSummary> {
   const [eonet, eqs] = await Promise.all([
     fetchEonetEvents(center, radiusKm, lookbackYears),
     fetchEarthquakes(center, radiusKm, lookbackYears, 3),
   ]);
 
-  const eonetByCategory: Record<string, number> = {};
+  // Count into a Map - faster than a plain object for arbitrary string
+  // keys and immune to prototype-key collisions - then snapshot to a
+  // Record for the JSON payload.
+  const categoryCounts = new Map<string, number>();
   for (const ev of eonet) {
     for (const c of ev.categories ?? []) {
-      eonetByCategory[c.title] = (eonetByCategory[c.title] ?? 0) + 1;
+      categoryCounts.set(c.title, (categoryCounts.get(c.title) ?? 0) + 1);
     }
   }
+  const eonetByCategory: Record<string, number> = Object.fromEntries(categoryCounts);
 
   const earthquakes = eqs.map((f) => ({
     id: f.id,
@@ -123,7 +154,7 @@ export async function buildHazardsSummary(center: LatLng, radiusKm: number, look
     };
   });
 
-  return {
+  const summary: HazardsSummary = {
     center,
     radiusKm,
     lookbackYears,
@@ -134,4 +165,6 @@ export async function buildHazardsSummary(center: LatLng, radiusKm: number, look
     earthquakes,
     eonetEvents,
   };
+  summaryCache.set(cacheKey, summary);
+  return summary;
 }
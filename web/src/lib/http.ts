@@ -0,0 +1,78 @@
+// Shared helpers for upstream API calls (EONET, USGS). Node's fetch pools
+// connections per host already; this centralizes timeouts, headers, and
+// error handling so every call site behaves the same way.
+
+const USER_AGENT = "disaster-advisory/0.1 (hackathon demo)";
+const DEFAULT_TIMEOUT_MS = 30_000;
+
+// Refuse to buffer pathological upstream bodies (e.g. an unbounded
+// earthquake query) before we pay for the parse.
+const MAX_RESPONSE_BYTES = 20_000_000;
+
+// Cap concurrent requests per upstream host so a burst of users (or the
+// notify script) queues politely instead of hammering EONET/USGS and
+// trading timeouts for 429s.
+const DEFAULT_HOST_CONCURRENCY = 6;
+
+class Semaphore {
+  private active = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(private readonly limit: number) {}
+
+  async acquire(): Promise<void> {
+    if (this.active < this.limit) {
+      this.active += 1;
+      return;
+    }
+    await new Promise<void>((resolve) => this.waiters.push(resolve));
+  }
+
+  release(): void {
+    const next = this.waiters.shift();
+    // Hand the slot directly to the next waiter so a racing acquire
+    // cannot oversubscribe the limit.
+    if (next) next();
+    else this.active -= 1;
+  }
+}
+
+const hostSemaphores = new Map<string, Semaphore>();
+
+function semaphoreForHost(host: string): Semaphore {
+  let sem = hostSemaphores.get(host);
+  if (!sem) {
+    sem = new Semaphore(DEFAULT_HOST_CONCURRENCY);
+    hostSemaphores.set(host, sem);
+  }
+  return sem;
+}
+
+export type FetchJsonOptions = {
+  // Next.js data-cache revalidation window in seconds.
+  revalidate?: number;
+  timeoutMs?: number;
+  // Prefix for error messages, e.g. "EONET request".
+  label?: string;
+};
+
+export async function fetchJson<T = unknown>(url: string, options: FetchJsonOptions = {}): Promise<T> {
+  const { revalidate, timeoutMs = DEFAULT_TIMEOUT_MS, label = "Upstream request" } = options;
+  const sem = semaphoreForHost(new URL(url).host);
+  await sem.acquire();
+  try {
+    const res = await fetch(url, {
+      headers: { "User-Agent": USER_AGENT, Accept: "application/json" },
+      next: revalidate !== undefined ? { revalidate } : undefined,
+      signal: AbortSignal.timeout(timeoutMs),
+    });
+    if (!res.ok) throw new Error(`${label} failed: ${res.status}`);
+    const contentLength = Number(res.headers.get("content-length"));
+    if (Number.isFinite(contentLength) && contentLength > MAX_RESPONSE_BYTES) {
+      throw new Error(`${label} response too large: ${contentLength} bytes`);
+    }
+    return (await res.json()) as T;
+  } finally {
+    sem.release();
+  }
+}
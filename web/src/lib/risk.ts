@@ -11,6 +11,31 @@ export type RiskBreakdown = {
   overall: number;
 };
 
+// Weighted overall risk (weights sum to 1). Module-level constant so the
+// hot scoring path reuses one object instead of rebuilding it per call.
+const RISK_WEIGHTS = {
+  earthquake: 0.30,
+  wildfire: 0.15,
+  severeStorm: 0.20,
+  volcano: 0.05,
+  flood: 0.20,
+  landslide: 0.05,
+  drought: 0.05,
+} as const;
+
+// Which EONET category titles feed each hazard. Earthquakes come from the
+// USGS count instead and are handled separately.
+const EONET_CATEGORY_SOURCES = {
+  wildfire: ["Wildfires"],
+  severeStorm: ["Severe Storms", "Tropical Cyclones"],
+  volcano: ["Volcanoes"],
+  flood: ["Floods"],
+  landslide: ["Landslides"],
+  drought: ["Drought"],
+} as const;
+
+type EonetHazard = keyof typeof EONET_CATEGORY_SOURCES;
+
 export function poissonProbability(expectedEventsPerPeriod: number): number {
   // Probability of at least one event in the period: 1 - e^{-lambda}
   const lambda = Math.max(0, expectedEventsPerPeriod);
@@ -19,55 +44,21 @@ export function poissonProbability(expectedEventsPerPeriod: number): number {
 
 export function computeRisk(summary: HazardsSummary): RiskBreakdown {
   const years = Math.max(1, summary.lookbackYears);
-
-  const eqPerYear = summary.counts.earthquakes / years;
-  const eqProb = poissonProbability(eqPerYear);
-
   const cat = summary.counts.eonetByCategory;
-  const wildfirePerYear = (cat["Wildfires"] ?? 0) / years;
-  const severeStormPerYear = ((cat["Severe Storms"] ?? 0) + (cat["Tropical Cyclones"] ?? 0)) / years;
-  const volcanoPerYear = (cat["Volcanoes"] ?? 0) / years;
-  const floodPerYear = (cat["Floods"] ?? 0) / years;
-  const landslidePerYear = (cat["Landslides"] ?? 0) / years;
-  const droughtPerYear = (cat["Drought"] ?? 0) / years;
-
-  const wildfireProb = poissonProbability(wildfirePerYear);
-  const stormProb = poissonProbability(severeStormPerYear);
-  const volcanoProb = poissonProbability(volcanoPerYear);
-  const floodProb = poissonProbability(floodPerYear);
-  const landslideProb = poissonProbability(landslidePerYear);
-  const droughtProb = poissonProbability(droughtPerYear);
 
-  // Weighted overall risk (weights sum to 1)
-  const weights = {
-    earthquake: 0.30,
-    wildfire: 0.15,
-    severeStorm: 0.20,
-    volcano: 0.05,
-    flood: 0.20,
-    landslide: 0.05,
-    drought: 0.05,
-  };
+  const earthquake = poissonProbability(summary.counts.earthquakes / years);
+  let overall = earthquake * RISK_WEIGHTS.earthquake;
 
-  const overall =
-    eqProb * weights.earthquake +
-    wildfireProb * weights.wildfire +
-    stormProb * weights.severeStorm +
-    volcanoProb * weights.volcano +
-    floodProb * weights.flood +
-    landslideProb * weights.landslide +
-    droughtProb * weights.drought;
+  const probs = {} as Record<EonetHazard, number>;
+  for (const hazard of Object.keys(EONET_CATEGORY_SOURCES) as EonetHazard[]) {
+    let count = 0;
+    for (const title of EONET_CATEGORY_SOURCES[hazard]) count += cat[title] ?? 0;
+    const prob = poissonProbability(count / years);
+    probs[hazard] = prob;
+    overall += prob * RISK_WEIGHTS[hazard];
+  }
 
-  return {
-    earthquake: eqProb,
-    wildfire: wildfireProb,
-    severeStorm: stormProb,
-    volcano: volcanoProb,
-    flood: floodProb,
-    landslide: landslideProb,
-    drought: droughtProb,
-    overall,
-  };
+  return { earthquake, ...probs, overall };
 }
 
 export function summarizeAdvice(risk: RiskBreakdown): { business: string; home: string; level: "low" | "moderate" | "high" } {
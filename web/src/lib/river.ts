@@ -1,4 +1,6 @@
-import { LatLng, haversineDistanceKm } from "@/lib/geo";
+import { TtlCache } from "@/lib/cache";
+import { LatLng, makeDistanceKmFrom } from "@/lib/geo";
+import { fetchJson } from "@/lib/http";
 
 export type GageSite = {
   siteCode: string;
@@ -19,7 +21,20 @@ export type RiverTrend = {
   message: string;
 };
 
+// Nearest-gage lookups cluster around where users actually are; keying on
+// coordinates rounded to ~0.1 deg (well inside the 0.5 deg search box) lets
+// nearby requests share one discovery call. Also caches "no gage" results.
+const gageCache = new TtlCache<GageSite | null>(500, 3_600_000);
+
+// Readings update every 15 minutes at best; 5 minutes matches the fetch
+// revalidate window below.
+const levelsCache = new TtlCache<GageReading[]>(500, 300_000);
+
 export async function findNearestUsgsGage(center: LatLng): Promise<GageSite | null> {
+  const cacheKey = `${center.lat.toFixed(1)},${center.lng.toFixed(1)}`;
+  const cached = gageCache.get(cacheKey);
+  if (cached !== undefined) return cached;
+
   // Query recent instantaneous values within a small bounding box to discover nearby gages
   const deltaDeg = 0.5; // ~55 km
   const west = center.lng - deltaDeg;
@@ -35,50 +50,87 @@ export async function findNearestUsgsGage(center: LatLng): Promise<GageSite | nu
     period: "P1D",
   });
   const url = `https://waterservices.usgs.gov/nwis/iv/?${params}`;
-  const res = await fetch(url, { next: { revalidate: 900 } });
-  if (!res.ok) throw new Error(`USGS IV discovery failed: ${res.status}`);
-  const data = await res.json();
+  const data = await fetchJson<{ value?: { timeSeries?: unknown[] } }>(url, {
+    revalidate: 900,
+    label: "USGS IV discovery",
+  });
   const series: unknown[] = data?.value?.timeSeries ?? [];
   type SourceInfo = {
     siteCode?: Array<{ value?: string }>;
     siteName?: string;
     geoLocation?: { geogLocation?: { latitude?: number; longitude?: number } };
   };
-  const candidates: GageSite[] = (series as Array<{ sourceInfo?: SourceInfo }>)
-    .map((ts) => ts?.sourceInfo)
-    .filter(Boolean)
-    .map((si) => ({
-      siteCode: String(si?.siteCode?.[0]?.value ?? ""),
-      siteName: String(si?.siteName ?? ""),
-      coordinates: {
-        lat: Number(si?.geoLocation?.geogLocation?.latitude),
-        lng: Number(si?.geoLocation?.geogLocation?.longitude),
-      },
-    }))
-    .filter((s: GageSite) => Number.isFinite(s.coordinates.lat) && Number.isFinite(s.coordinates.lng));
-  if (!candidates.length) return null;
+  // Single pass: extract, validate, and track the nearest site as we go,
+  // instead of materializing intermediate candidate arrays.
+  const distanceFrom = makeDistanceKmFrom(center);
   let best: GageSite | null = null;
   let bestD = Infinity;
-  for (const s of candidates) {
-    const d = haversineDistanceKm(center, s.coordinates);
+  for (const ts of series as Array<{ sourceInfo?: SourceInfo }>) {
+    const si = ts?.sourceInfo;
+    if (!si) continue;
+    const lat = Number(si.geoLocation?.geogLocation?.latitude);
+    const lng = Number(si.geoLocation?.geogLocation?.longitude);
+    if (!Number.isFinite(lat) || !Number.isFinite(lng)) continue;
+    const d = distanceFrom({ lat, lng });
     if (d < bestD) {
-      best = s;
+      best = {
+        siteCode: String(si.siteCode?.[0]?.value ?? ""),
+        siteName: String(si.siteName ?? ""),
+        coordinates: { lat, lng },
+      };
       bestD = d;
     }
   }
+  gageCache.set(cacheKey, best);
   return best;
 }
 
 export async function fetchGageLevels(siteCode: string): Promise<GageReading[]> {
+  const cached = levelsCache.get(siteCode);
+  if (cached) return cached;
+
   const params = new URLSearchParams({ format: "json", sites: siteCode, parameterCd: "00065", period: "P3D" });
   const url = `https://waterservices.usgs.gov/nwis/iv/?${params}`;
-  const res = await fetch(url, { next: { revalidate: 300 } });
-  if (!res.ok) throw new Error(`USGS IV failed: ${res.status}`);
-  const data = await res.json();
+  type IvValues = { value?: { timeSeries?: Array<{ values?: Array<{ value?: unknown[] }> }> } };
+  const data = await fetchJson<IvValues>(url, { revalidate: 300, label: "USGS IV" });
   const points: unknown[] = data?.value?.timeSeries?.[0]?.values?.[0]?.value ?? [];
-  return (points as Array<{ dateTime?: string; value?: string | number }>)
-    .map((p) => ({ timestamp: String(p?.dateTime ?? ""), value: Number(p?.value) }))
-    .filter((r: GageReading) => Number.isFinite(r.value));
+  // One pass, one Number() coercion per point; non-numeric readings are
+  // dropped without ever allocating an object for them.
+  const readings: GageReading[] = [];
+  for (const p of points as Array<{ dateTime?: string; value?: string | number }>) {
+    const value = Number(p?.value);
+    if (!Number.isFinite(value)) continue;
+    readings.push({ timestamp: String(p?.dateTime ?? ""), value });
+  }
+  levelsCache.set(siteCode, readings);
+  return readings;
+}
+
+// Least-squares slope of gage level vs time, in level units per hour.
+// Single pass; times are offset from the first reading so the sums stay
+// small and do not lose precision on epoch-sized values.
+function leastSquaresRatePerHour(readings: GageReading[]): number {
+  let origin: number | null = null;
+  let n = 0;
+  let sumX = 0;
+  let sumY = 0;
+  let sumXY = 0;
+  let sumXX = 0;
+  for (const r of readings) {
+    const t = new Date(r.timestamp).getTime();
+    if (!Number.isFinite(t)) continue;
+    if (origin === null) origin = t;
+    const x = (t - origin) / 3600000;
+    n += 1;
+    sumX += x;
+    sumY += r.value;
+    sumXY += x * r.value;
+    sumXX += x * x;
+  }
+  if (n < 2) return 0;
+  const denom = n * sumXX - sumX * sumX;
+  if (denom === 0) return 0;
+  return (n * sumXY - sumX * sumY) / denom;
 }
 
 export function analyzeRiverTrend(site: GageSite, readings: GageReading[]): RiverTrend {
@@ -86,11 +138,9 @@ export function analyzeRiverTrend(site: GageSite, readings: GageReading[]): Rive
     return { site, readings, rising: false, riseRatePerHour: 0, message: "Insufficient data" };
   }
   const recent = readings.slice(-12); // last ~12 samples
-  const first = new Date(recent[0].timestamp).getTime();
-  const last = new Date(recent[recent.length - 1].timestamp).getTime();
-  const hours = Math.max(0.1, (last - first) / 3600000);
-  const delta = recent[recent.length - 1].value - recent[0].value;
-  const rate = delta / hours;
+  // Fit across the whole window instead of differencing the endpoints, so
+  // one noisy sample no longer flips the trend.
+  const rate = leastSquaresRatePerHour(recent);
   const rising = rate > 0.01; // 1 cm/hour threshold if units are feet, still relative
 
   const message = rising